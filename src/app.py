@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import bisect
 import calendar
+import email.utils
+import functools
+import io
 import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, SupportsInt, cast
+from xml.etree import ElementTree
 
 import boto3
-import feedparser
+import urllib3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
+    from _typeshed import SupportsRead
     from aws_lambda_typing.context import Context
     from aws_lambda_typing.events import EventBridgeEvent
-    from feedparser import FeedParserDict
     from mypy_boto3_dynamodb import DynamoDBServiceResource
     from mypy_boto3_dynamodb.service_resource import Table
     from mypy_boto3_sns import SNSClient
@@ -24,29 +31,124 @@ if TYPE_CHECKING:
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
+# Lambda configuration. The environment is fixed for the lifetime of the
+# container, so it is read once at import rather than on every invocation.
+TABLE_NAME = os.environ.get("TABLE_NAME")
+TOPIC_ARN = os.environ.get("TOPIC_ARN")
+# Parse the feed with feedparser instead of the built-in RSS reader.
+USE_FEEDPARSER = os.environ.get("USE_FEEDPARSER") == "true"
+
 SPITZ_NEWS_FEED_URL = "https://spitz-web.com/news/feed"
 LAST_SEEN_KEY = "last_seen_pub_timestamp"
+USER_AGENT = "spitz-news-mikke/1.0"
+# Bound once so parsing each pubDate skips the module attribute lookups.
+_parse_date = email.utils.parsedate_to_datetime
+JST = timezone(timedelta(hours=9))
+NOTIFICATION_HEADER = "新しいスピッツのニュースがあります！\n\n"
+NOTIFICATION_SUBJECT_FORMAT = "【スピッツニュース】新着ニュース (%d件) があります！"
+# Feeds longer than this are searched with bisect instead of a linear scan.
+BISECT_MIN_ENTRIES = 64
+
+# Keep sockets alive so warm invocations reuse TCP/TLS connections, and back
+# off client-side when DynamoDB or SNS throttle.
+AWS_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    connect_timeout=1,
+    read_timeout=3,
+)
+
+# Shared worker pool for overlapping independent network calls.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Headers sent with every feed request. Compressed responses are requested
+# and transparently decoded by urllib3. These are merged into each request's
+# headers, since urllib3 replaces pool-level headers with per-request ones.
+_FEED_REQUEST_HEADERS = urllib3.make_headers(
+    accept_encoding=True, user_agent=USER_AGENT
+)
+
+# Pooled HTTP connection to the feed host, kept alive across warm invocations.
+# At most one retry, so two attempts at the full connect and read timeouts
+# (24 s) still end inside the function's 30 s timeout.
+_HTTP = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=2,
+    timeout=urllib3.Timeout(connect=2, read=10),
+    retries=urllib3.Retry(total=1),
+)
+
+# ETag and Last-Modified of the last feed this container fully processed.
+# None until the first successful invocation in this container.
+_feed_validators: tuple[str | None, str | None] | None = None
+
+
+class FeedEntry(NamedTuple):
+    """A news article read from the feed."""
+
+    title: str
+    link: str
+    # Publication time as a UTC struct_time
+    published_parsed: time.struct_time
+
+
+class FeedState(NamedTuple):
+    """The feed state persisted in DynamoDB."""
+
+    last_seen_timestamp: int
+    etag: str | None = None
+    modified: str | None = None
+    # Set while a notification for articles newer than this is undelivered.
+    pending_since: int | None = None
+
+
+class Feed(NamedTuple):
+    """The result of fetching the news feed."""
+
+    status: int
+    entries: list[FeedEntry]
+    etag: str | None = None
+    modified: str | None = None
 
 
 def filter_new_articles(
-    feed_entries: list[FeedParserDict], last_seen_timestamp: int
-) -> list[FeedParserDict]:
+    feed_entries: list[FeedEntry], last_seen_timestamp: int
+) -> list[FeedEntry]:
     """Filters new articles from the feed entries based on the last seen timestamp.
 
+    The entries are expected newest first, as the feed lists them, so the
+    scan stops at the first entry that is not newer than the last seen one.
+
     Args:
-        feed_entries (list[FeedParserDict]): A list of feed entry objects.
+        feed_entries (list[FeedEntry]): A list of feed entry objects.
         last_seen_timestamp (int): UTC timestamp of the last processed article.
 
     Returns:
-        list[FeedParserDict]: A list of new article entries, sorted from newest to oldest.
+        list[FeedEntry]: A list of new article entries, sorted from newest to
+            oldest.
     """
-    new_articles = []
+    # published_parsed is a time.struct_time in UTC, so comparing its
+    # (Y, M, D, h, m, s) prefix orders entries without converting each one.
+    threshold = time.gmtime(last_seen_timestamp)[:6]
+
+    if len(feed_entries) > BISECT_MIN_ENTRIES:
+        # The feed is sorted newest first, so "already seen" is False for a
+        # prefix of the entries and True for the rest.
+        end = bisect.bisect_left(
+            feed_entries,
+            True,
+            key=lambda entry: entry.published_parsed[:6] <= threshold,
+        )
+        return feed_entries[:end]
+
+    # Bind append to a local so each iteration uses a fast local lookup.
+    new_articles: list[FeedEntry] = []
+    append = new_articles.append
     for entry in feed_entries:
-        # published_parsed is a time.struct_time in UTC
-        entry_timestamp = calendar.timegm(entry.published_parsed)
-        if entry_timestamp <= last_seen_timestamp:
+        if entry.published_parsed[:6] <= threshold:
             break
-        new_articles.append(entry)
+        append(entry)
 
     # Newest articles are at the beginning of the feed.
     return new_articles
@@ -62,55 +164,396 @@ def get_aws_resources() -> tuple[DynamoDBServiceResource, SNSClient]:
     if os.environ.get("AWS_SAM_LOCAL") == "true":
         endpoint_url = os.environ.get("AWS_ENDPOINT_URL")
         logger.info("Running in SAM Local. Endpoint: %s", endpoint_url)
-        dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url)
-        sns = boto3.client("sns", endpoint_url=endpoint_url)
+        dynamodb = boto3.resource(
+            "dynamodb", config=AWS_CLIENT_CONFIG, endpoint_url=endpoint_url
+        )
+        sns = boto3.client("sns", config=AWS_CLIENT_CONFIG, endpoint_url=endpoint_url)
     else:
-        dynamodb = boto3.resource("dynamodb")
-        sns = boto3.client("sns")
+        dynamodb = boto3.resource("dynamodb", config=AWS_CLIENT_CONFIG)
+        sns = boto3.client("sns", config=AWS_CLIENT_CONFIG)
     return dynamodb, sns
 
 
-def get_last_seen_timestamp(table: Table) -> int:
-    """Retrieves the last seen publication timestamp from DynamoDB.
+# Create the AWS clients and Table resource once per container, during the
+# Lambda init phase, so warm invocations skip boto3's endpoint, credential and
+# service model setup. If this fails at import time (e.g. no region
+# configured), initialization is retried on first use.
+_DYNAMODB: DynamoDBServiceResource | None = None
+_SNS: SNSClient | None = None
+_TABLE: Table | None = None
+try:
+    _DYNAMODB, _SNS = get_aws_resources()
+    if TABLE_NAME:
+        _TABLE = _DYNAMODB.Table(TABLE_NAME)
+except Exception as e:
+    logger.warning("Deferring AWS client initialization: %s", e)
+if not TABLE_NAME or not TOPIC_ARN:
+    logger.warning(
+        "Required environment variables (TABLE_NAME, TOPIC_ARN) are missing."
+    )
+
+
+def get_cached_resources(table_name: str) -> tuple[Table, SNSClient]:
+    """Returns the DynamoDB table and SNS client cached for this container.
+
+    Args:
+        table_name (str): The name of the DynamoDB table.
+
+    Returns:
+        tuple[Table, SNSClient]: A tuple containing the DynamoDB Table resource
+            and SNS client.
+    """
+    global _DYNAMODB, _SNS, _TABLE
+    if _DYNAMODB is None or _SNS is None:
+        _DYNAMODB, _SNS = get_aws_resources()
+    if _TABLE is None or _TABLE.name != table_name:
+        _TABLE = _DYNAMODB.Table(table_name)
+    return _TABLE, _SNS
+
+
+def _to_timestamp(val: object) -> int:
+    """Converts a numeric DynamoDB attribute to an integer timestamp.
+
+    Args:
+        val (object): The attribute value.
+
+    Returns:
+        int: The timestamp.
+
+    Raises:
+        TypeError: If the value is not a finite number, including numeric
+            strings and booleans.
+    """
+    # boto3 returns numbers as Decimal; this Lambda is the only writer, so
+    # convert directly and only rule out the types int() would also accept.
+    if isinstance(val, (str, bool)):
+        raise TypeError(f"Unexpected type for timestamp: {type(val)}")
+    try:
+        return int(cast(SupportsInt, val))
+    except (TypeError, ValueError, OverflowError):
+        raise TypeError(f"Unexpected type for timestamp: {type(val)}") from None
+
+
+def get_feed_state(table: Table) -> FeedState:
+    """Retrieves the feed state from DynamoDB.
 
     Args:
         table (Table): The DynamoDB Table resource.
 
     Returns:
-        int: The last seen timestamp (UTC). Defaults to 0 if not found.
+        FeedState: The last seen timestamp (UTC), the feed's HTTP cache
+            validators and any pending notification. The timestamp defaults to
+            0 and the other fields to None if not found.
 
     Raises:
-        TypeError: If the retrieved timestamp has an unexpected type.
+        TypeError: If a retrieved timestamp has an unexpected type.
     """
-    response = table.get_item(Key={"settingName": LAST_SEEN_KEY})
+    # Only this function writes the item, so an eventually consistent read of
+    # just the attributes we use is sufficient.
+    response = table.get_item(
+        Key={"settingName": LAST_SEEN_KEY},
+        ProjectionExpression="#v, #etag, #mod, #since",
+        ExpressionAttributeNames={
+            "#v": "value",
+            "#etag": "etag",
+            "#mod": "modified",
+            "#since": "pendingSince",
+        },
+        ConsistentRead=False,
+    )
     item = response.get("Item")
     if not item:
-        return 0
+        return FeedState(0)
+
+    etag = item.get("etag")
+    modified = item.get("modified")
+    # Validators are only meaningful as strings; ignore anything else.
+    etag = etag if isinstance(etag, str) else None
+    modified = modified if isinstance(modified, str) else None
+
+    since = item.get("pendingSince")
+    pending_since = None if since is None else _to_timestamp(since)
 
     val = item.get("value")
     if val is None:
-        return 0
+        return FeedState(0, etag, modified, pending_since)
 
-    if isinstance(val, (int, float, Decimal)):
-        return int(val)
+    return FeedState(_to_timestamp(val), etag, modified, pending_since)
 
-    raise TypeError(f"Unexpected type for timestamp: {type(val)}")
 
+def update_feed_state(
+    table: Table,
+    timestamp: int,
+    etag: str | None,
+    modified: str | None,
+    pending_since: int,
+    retrying: bool = False,
+) -> bool:
+    """Advances the feed state and marks its notification as pending.
 
-def update_last_seen_timestamp(table: Table, timestamp: int) -> None:
-    """Updates the last seen publication timestamp in DynamoDB.
+    The write is conditional on the stored timestamp being older, so a
+    concurrent invocation that already saved a newer one is not overwritten.
+    When retrying a notification that was read as pending, rewriting the same
+    timestamp is also allowed as long as the same notification is still
+    pending, so a failed notification can be resent.
 
     Args:
         table (Table): The DynamoDB Table resource.
         timestamp (int): The new timestamp to save.
+        etag (str | None): The ETag returned with the feed, if any.
+        modified (str | None): The Last-Modified value returned with the feed,
+            if any.
+        pending_since (int): The timestamp the pending notification covers
+            articles after.
+        retrying (bool): Whether the caller read this pending notification
+            from the stored state and is resending it.
+
+    Returns:
+        bool: True if the state was updated, False if another invocation has
+            already recorded these articles.
     """
-    table.put_item(
-        Item={
-            "settingName": LAST_SEEN_KEY,
-            "value": timestamp,
-        }
-    )
+    set_actions = ["#v = :new", "#since = :since"]
+    remove_actions = []
+    values: dict[str, Any] = {":new": timestamp, ":since": pending_since}
+    if etag:
+        set_actions.append("#etag = :etag")
+        values[":etag"] = etag
+    else:
+        remove_actions.append("#etag")
+    if modified:
+        set_actions.append("#mod = :mod")
+        values[":mod"] = modified
+    else:
+        remove_actions.append("#mod")
+
+    update_expression = "SET " + ", ".join(set_actions)
+    if remove_actions:
+        update_expression += " REMOVE " + ", ".join(remove_actions)
+
+    condition_expression = "attribute_not_exists(#v) OR #v < :new"
+    if retrying:
+        # Only a caller that read the pending marker may take it over; a
+        # first-time writer must not republish articles another run owns.
+        condition_expression += " OR (#v = :new AND #since = :since)"
+
+    try:
+        table.update_item(
+            Key={"settingName": LAST_SEEN_KEY},
+            UpdateExpression=update_expression,
+            ConditionExpression=condition_expression,
+            ExpressionAttributeNames={
+                "#v": "value",
+                "#etag": "etag",
+                "#mod": "modified",
+                "#since": "pendingSince",
+            },
+            ExpressionAttributeValues=values,
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+        logger.info("Stored timestamp is already at or past %d.", timestamp)
+        return False
     logger.info("Updated last seen timestamp to: %d", timestamp)
+    return True
+
+
+def clear_pending_notification(table: Table, timestamp: int) -> None:
+    """Marks the notification for the given timestamp as delivered.
+
+    The pending marker is left alone if another invocation has since advanced
+    the timestamp, as it then belongs to that invocation.
+
+    Args:
+        table (Table): The DynamoDB Table resource.
+        timestamp (int): The timestamp whose notification was delivered.
+    """
+    try:
+        table.update_item(
+            Key={"settingName": LAST_SEEN_KEY},
+            UpdateExpression="REMOVE #since",
+            ConditionExpression="#v = :ts",
+            ExpressionAttributeNames={"#v": "value", "#since": "pendingSince"},
+            ExpressionAttributeValues={":ts": timestamp},
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+        logger.info("Timestamp advanced past %d; keeping pending marker.", timestamp)
+
+
+def _parse_pub_date(value: str | None) -> time.struct_time | None:
+    """Parses an item's pubDate into a UTC struct_time.
+
+    RFC 822 dates, which RSS 2.0 requires, are tried first. ISO 8601 dates
+    are accepted as a fallback for feeds that emit them instead.
+
+    Args:
+        value (str | None): The pubDate text, if the item has one.
+
+    Returns:
+        time.struct_time | None: The date in UTC, or None if it is missing
+            or cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return _parse_date(value).utctimetuple()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value.strip()).utctimetuple()
+    except ValueError:
+        return None
+
+
+def parse_spitz_feed(source: bytes | SupportsRead[bytes]) -> list[FeedEntry]:
+    """Parses the items of an RSS 2.0 feed with ElementTree.
+
+    The document is read incrementally with ``iterparse`` and each item is
+    cleared once its title, link and pubDate have been read, so the parsed
+    tree never holds more than one item's children. Items without a pubDate
+    are skipped, as are items whose pubDate cannot be parsed.
+
+    Args:
+        source (bytes | SupportsRead[bytes]): The raw feed document, or a
+            binary stream such as an unread HTTP response to parse it from.
+
+    Returns:
+        list[FeedEntry]: The feed items in document order.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    entries = []
+    for _, item in ElementTree.iterparse(source, events=("end",)):
+        if item.tag != "item":
+            continue
+        published = _parse_pub_date(item.findtext("pubDate"))
+        if published is None:
+            logger.warning("Skipping feed item without a valid pubDate.")
+        else:
+            entries.append(
+                FeedEntry(
+                    title=item.findtext("title", ""),
+                    link=item.findtext("link", ""),
+                    published_parsed=published,
+                )
+            )
+        item.clear()
+    return entries
+
+
+def parse_feed_with_feedparser(body: bytes, headers: dict[str, str]) -> list[FeedEntry]:
+    """Parses the feed with feedparser, for feeds the RSS reader cannot handle.
+
+    Entries without a parsable publication date are skipped, as
+    parse_spitz_feed does.
+
+    Args:
+        body (bytes): The raw feed document.
+        headers (dict[str, str]): The HTTP response headers.
+
+    Returns:
+        list[FeedEntry]: The feed entries in document order.
+    """
+    # Imported here so the default ElementTree path does not pay for loading
+    # feedparser and its sgmllib dependency at cold start.
+    import feedparser
+
+    # feedparser expects lower-case header names, as its own HTTP client uses.
+    response_headers = {k.lower(): v for k, v in headers.items()}
+    # Only titles, links and dates are read, so skip the HTML sanitizer and
+    # relative URI resolution that dominate feedparser's per-entry cost.
+    parsed = feedparser.parse(
+        body,
+        response_headers=response_headers,
+        resolve_relative_uris=False,
+        sanitize_html=False,
+    )
+    entries = []
+    for entry in parsed.entries:
+        published = entry.get("published_parsed")
+        if published is None:
+            logger.warning("Skipping feed entry without a valid publication date.")
+            continue
+        entries.append(
+            FeedEntry(
+                title=entry.get("title", ""),
+                link=entry.get("link", ""),
+                published_parsed=published,
+            )
+        )
+    return entries
+
+
+def fetch_feed(etag: str | None, modified: str | None) -> Feed:
+    """Fetches and parses the Spitz news feed with a conditional request.
+
+    The Spitz news feed is RSS 2.0, so it is parsed directly with
+    parse_spitz_feed without probing its format, unless USE_FEEDPARSER is set.
+
+    Args:
+        etag (str | None): The ETag to send as If-None-Match, if any.
+        modified (str | None): The Last-Modified value to send as
+            If-Modified-Since, if any.
+
+    Returns:
+        Feed: The fetched feed. Its status is 304 and it has no entries when
+            the feed has not changed.
+    """
+    headers = dict(_FEED_REQUEST_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    # The body is streamed into the parser rather than buffered in
+    # response.data, so only the current chunk and item are held in memory.
+    response = _HTTP.request(
+        "GET", SPITZ_NEWS_FEED_URL, headers=headers, preload_content=False
+    )
+    try:
+        if response.status == 304:
+            return Feed(status=304, entries=[])
+        if response.status != 200:
+            logger.error("Unexpected HTTP status fetching feed: %d", response.status)
+            return Feed(status=response.status, entries=[])
+
+        if USE_FEEDPARSER:
+            entries = parse_feed_with_feedparser(
+                response.read(), dict(response.headers)
+            )
+        else:
+            entries = parse_spitz_feed(response)
+    finally:
+        response.drain_conn()
+        response.release_conn()
+    return Feed(
+        status=response.status,
+        entries=entries,
+        etag=response.headers.get("ETag") or None,
+        modified=response.headers.get("Last-Modified") or None,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_utc_minute_as_jst(
+    year: int, month: int, day: int, hour: int, minute: int
+) -> str:
+    """Formats a UTC date and time, truncated to minutes, as a JST string.
+
+    Args:
+        year (int): The year in UTC.
+        month (int): The month in UTC.
+        day (int): The day in UTC.
+        hour (int): The hour in UTC.
+        minute (int): The minute in UTC.
+
+    Returns:
+        str: The formatted time string in JST (YYYY/MM/DD HH:mm).
+    """
+    dt_utc = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+    return dt_utc.astimezone(JST).strftime("%Y/%m/%d %H:%M")
 
 
 def convert_utc_struct_time_to_jst_string(utc_struct_time: time.struct_time) -> str:
@@ -122,37 +565,34 @@ def convert_utc_struct_time_to_jst_string(utc_struct_time: time.struct_time) ->
     Returns:
         str: The formatted time string in JST (YYYY/MM/DD HH:mm).
     """
-    JST = timezone(timedelta(hours=9))
-    # struct_time to datetime (UTC)
-    dt_utc = datetime(*utc_struct_time[:6], tzinfo=timezone.utc)
-    # Convert to JST
-    dt_jst = dt_utc.astimezone(JST)
-    return dt_jst.strftime("%Y/%m/%d %H:%M")
+    # The output has minute precision, so cache on the minute prefix.
+    return _format_utc_minute_as_jst(*utc_struct_time[:5])
 
 
 def send_notification(
-    sns: SNSClient, topic_arn: str, new_articles: list[FeedParserDict]
+    sns: SNSClient, topic_arn: str, new_articles: list[FeedEntry]
 ) -> None:
     """Formats and sends an SNS notification for new articles.
 
     Args:
         sns (SNSClient): The SNS client.
         topic_arn (str): The SNS topic ARN.
-        new_articles (list[FeedParserDict]): A list of new article entries.
+        new_articles (list[FeedEntry]): A list of new article entries.
     """
-    message_body = "新しいスピッツのニュースがあります！\n\n"
+    parts = [NOTIFICATION_HEADER]
     for article in new_articles:
-        message_body += f"タイトル: {article.title}\n"
-        message_body += f"URL: {article.link}\n"
         formatted_date = convert_utc_struct_time_to_jst_string(article.published_parsed)
-        message_body += f"公開日: {formatted_date}\n\n"
+        parts.append(
+            f"タイトル: {article.title}\n"
+            f"URL: {article.link}\n"
+            f"公開日: {formatted_date}\n\n"
+        )
+    message_body = "".join(parts)
 
     sns.publish(
         TopicArn=topic_arn,
         Message=message_body,
-        Subject=(
-            f"【スピッツニュース】新着ニュース ({len(new_articles)}件) があります！"
-        ),
+        Subject=NOTIFICATION_SUBJECT_FORMAT % len(new_articles),
     )
     logger.info("Published SNS notification with %d new articles.", len(new_articles))
 
@@ -168,12 +608,13 @@ def lambda_handler(event: EventBridgeEvent, context: Context) -> dict[str, Any]:
     Returns:
         dict[str, Any]: A dictionary with a status code and body.
     """
-    logger.info("Received event: %s", json.dumps(event))
-
-    # Get configuration from environment variables
-    table_name = os.environ.get("TABLE_NAME")
-    topic_arn = os.environ.get("TOPIC_ARN")
+    global _feed_validators
+    # Only serialize the event when it will actually be logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
 
+    table_name = TABLE_NAME
+    topic_arn = TOPIC_ARN
     if not table_name or not topic_arn:
         logger.error(
             "Required environment variables (TABLE_NAME, TOPIC_ARN) are missing."
@@ -186,13 +627,49 @@ def lambda_handler(event: EventBridgeEvent, context: Context) -> dict[str, Any]:
         }
 
     try:
-        dynamodb, sns = get_aws_resources()
-        table = dynamodb.Table(table_name)
+        table, sns = get_cached_resources(table_name)
+
+        if _feed_validators is None:
+            # Cold start: the validators are only available from DynamoDB.
+            state = get_feed_state(table)
+            if state.pending_since is None:
+                feed = fetch_feed(state.etag, state.modified)
+            else:
+                feed = fetch_feed(None, None)
+        else:
+            # Warm start: fetch with this container's validators while the
+            # state is read from DynamoDB.
+            state_future = _EXECUTOR.submit(get_feed_state, table)
+            feed_future = _EXECUTOR.submit(fetch_feed, *_feed_validators)
+            state = state_future.result()
+            feed = feed_future.result()
+            if feed.status == 304 and state.pending_since is not None:
+                # The pending articles have to be re-read from the feed.
+                feed = fetch_feed(None, None)
+        logger.info("Last seen pub timestamp: %d", state.last_seen_timestamp)
+
+        if state.pending_since is None:
+            baseline_timestamp = state.last_seen_timestamp
+        else:
+            # A previous notification was not delivered; resend those articles.
+            baseline_timestamp = state.pending_since
+            logger.warning(
+                "Retrying undelivered notification for articles after %d.",
+                baseline_timestamp,
+            )
 
-        last_seen_timestamp = get_last_seen_timestamp(table)
-        logger.info("Last seen pub timestamp: %d", last_seen_timestamp)
+        # 304 Not Modified: the feed is unchanged since the last successful run.
+        if feed.status == 304:
+            logger.info("Feed not modified since last check.")
+            if _feed_validators is None and state.pending_since is None:
+                # The stored validators are current, so later invocations in
+                # this container can fetch while the state is read.
+                _feed_validators = (state.etag, state.modified)
+            return {
+                "statusCode": 200,
+                "body": json.dumps({"message": "No new news found."}),
+            }
 
-        feed = feedparser.parse(SPITZ_NEWS_FEED_URL)
         if not feed.entries:
             logger.error("No entries found in the Spitz news feed.")
             return {
@@ -200,24 +677,52 @@ def lambda_handler(event: EventBridgeEvent, context: Context) -> dict[str, Any]:
                 "body": json.dumps({"message": "No entries found in feed."}),
             }
 
-        new_articles = filter_new_articles(feed.entries, last_seen_timestamp)
+        # The feed is newest first, so the first entry tells whether anything
+        # is new without scanning the rest.
+        latest_feed_timestamp = calendar.timegm(feed.entries[0].published_parsed)
+        if latest_feed_timestamp > baseline_timestamp:
+            new_articles = filter_new_articles(feed.entries, baseline_timestamp)
+        else:
+            new_articles = []
+        validators = (feed.etag, feed.modified)
 
         if not new_articles:
+            if state.pending_since is not None:
+                clear_pending_notification(table, state.last_seen_timestamp)
+            _feed_validators = validators
             logger.info(
                 "No new news found. Baseline timestamp remains %d.",
-                last_seen_timestamp,
+                baseline_timestamp,
             )
             return {
                 "statusCode": 200,
                 "body": json.dumps({"message": "No new news found."}),
             }
 
-        # Update the last seen timestamp in DynamoDB
-        latest_feed_timestamp = calendar.timegm(feed.entries[0].published_parsed)
-        update_last_seen_timestamp(table, latest_feed_timestamp)
+        # Record the new timestamp with the notification marked as pending
+        # before publishing, so a failed publish is retried on the next run.
+        recorded_timestamp = latest_feed_timestamp
+        if state.pending_since is not None:
+            # The newest article recorded by the failed run may have left the
+            # feed. Keep its timestamp so the retry still matches the stored
+            # value and can take over the pending marker.
+            recorded_timestamp = max(latest_feed_timestamp, state.last_seen_timestamp)
+        if not update_feed_state(
+            table,
+            recorded_timestamp,
+            *validators,
+            pending_since=baseline_timestamp,
+            retrying=state.pending_since is not None,
+        ):
+            logger.info("Another invocation is already notifying these articles.")
+            return {
+                "statusCode": 200,
+                "body": json.dumps({"message": "No new news found."}),
+            }
 
-        # Send notification
         send_notification(sns, topic_arn, new_articles)
+        clear_pending_notification(table, recorded_timestamp)
+        _feed_validators = validators
 
         return {
             "statusCode": 200,
@@ -230,8 +735,9 @@ def lambda_handler(event: EventBridgeEvent, context: Context) -> dict[str, Any]:
             ),
         }
 
-    except Exception as e:
-        logger.error("Error processing news feed: %s", e)
+    except ClientError as e:
+        # Other exceptions propagate so Lambda records them as errors.
+        logger.error("AWS request failed while processing news feed: %s", e)
         return {
             "statusCode": 500,
             "body": json.dumps({"message": f"Error: {str(e)}"}),
@@ -1,18 +1,38 @@
 import calendar
+import io
 import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from decimal import Decimal
 from typing import Any, cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
+import feedparser
 import pytest
+from botocore.exceptions import ClientError
+from urllib3 import HTTPHeaderDict, HTTPResponse
 
 from src.app import (
+    _HTTP,
+    AWS_CLIENT_CONFIG,
+    BISECT_MIN_ENTRIES,
+    FeedState,
+    clear_pending_notification,
     convert_utc_struct_time_to_jst_string,
+    fetch_feed,
     filter_new_articles,
     get_aws_resources,
-    get_last_seen_timestamp,
+    get_cached_resources,
+    get_feed_state,
     lambda_handler,
+    parse_feed_with_feedparser,
+    parse_spitz_feed,
     send_notification,
-    update_last_seen_timestamp,
+    update_feed_state,
 )
 
 
@@ -54,6 +74,48 @@ def test_filter_new_articles_logic() -> None:
     assert len(new) == 0
 
 
+def test_filter_new_articles_long_feed() -> None:
+    """Test that long feeds searched with bisect give the same result."""
+
+    class Entry:
+        def __init__(self, link: str, published_parsed: tuple[int, ...]) -> None:
+            self.link = link
+            self.published_parsed = published_parsed
+
+    # 100 entries, one per hour, newest first
+    newest = calendar.timegm((2026, 2, 18, 12, 0, 0, 2, 49, 0))
+    entries = [
+        Entry(f"https://spitz-web.com/news/{8000 - i}/", time.gmtime(newest - i * 3600))
+        for i in range(100)
+    ]
+    assert len(entries) > BISECT_MIN_ENTRIES
+
+    new = filter_new_articles(entries, newest - 3 * 3600)
+    assert [e.link for e in new] == [e.link for e in entries[:3]]
+
+    assert filter_new_articles(entries, newest) == []
+    assert filter_new_articles(entries, 0) == entries
+
+
+def test_filter_new_articles_early_exit() -> None:
+    """Test that filtering stops at the first entry that is not new."""
+
+    class Entry:
+        def __init__(self, link: str, published_parsed: tuple[int, ...]) -> None:
+            self.link = link
+            self.published_parsed = published_parsed
+
+    last_seen = calendar.timegm((2026, 2, 17, 12, 0, 0, 1, 48, 0))
+    entries = [
+        Entry("https://spitz-web.com/news/7915/", time.gmtime(last_seen + 3600)),
+        Entry("https://spitz-web.com/news/7914/", time.gmtime(last_seen - 3600)),
+        Entry("https://spitz-web.com/news/7913/", time.gmtime(last_seen + 7200)),
+    ]
+
+    new = filter_new_articles(entries, last_seen)
+    assert [e.link for e in new] == ["https://spitz-web.com/news/7915/"]
+
+
 def test_convert_utc_struct_time_to_jst_string() -> None:
     """Test convert_utc_struct_time_to_jst_string converts correctly."""
     # 2026-02-18 12:00:00 UTC -> 2026-02-18 21:00:00 JST
@@ -77,9 +139,13 @@ def test_get_aws_resources_local(
     with patch.dict(os.environ, env):
         get_aws_resources()
         mock_dynamodb_resource.assert_called_with(
-            "dynamodb", endpoint_url="http://localhost:4566"
+            "dynamodb",
+            config=AWS_CLIENT_CONFIG,
+            endpoint_url="http://localhost:4566",
+        )
+        mock_sns_client.assert_called_with(
+            "sns", config=AWS_CLIENT_CONFIG, endpoint_url="http://localhost:4566"
         )
-        mock_sns_client.assert_called_with("sns", endpoint_url="http://localhost:4566")
 
 
 @patch("src.app.boto3.resource")
@@ -90,46 +156,507 @@ def test_get_aws_resources_default(
     """Test get_aws_resources when running in standard AWS environment."""
     with patch.dict(os.environ, {}, clear=True):
         get_aws_resources()
-        mock_dynamodb_resource.assert_called_with("dynamodb")
-        mock_sns_client.assert_called_with("sns")
+        mock_dynamodb_resource.assert_called_with(
+            "dynamodb", config=AWS_CLIENT_CONFIG
+        )
+        mock_sns_client.assert_called_with("sns", config=AWS_CLIENT_CONFIG)
+
+
+@patch("src.app._TABLE", None)
+@patch("src.app._SNS", None)
+@patch("src.app._DYNAMODB", None)
+@patch("src.app.get_aws_resources")
+def test_get_cached_resources(mock_get_aws: MagicMock) -> None:
+    """Test get_cached_resources initializes clients once and reuses them."""
+    mock_dynamodb = MagicMock()
+    mock_sns = MagicMock()
+    mock_get_aws.return_value = (mock_dynamodb, mock_sns)
+    mock_dynamodb.Table.return_value.name = "test-table"
+
+    first = get_cached_resources("test-table")
+    second = get_cached_resources("test-table")
+
+    assert first == (mock_dynamodb.Table.return_value, mock_sns)
+    assert second == first
+    mock_get_aws.assert_called_once()
+    mock_dynamodb.Table.assert_called_once_with("test-table")
+
+
+def test_module_init_creates_table() -> None:
+    """Test that importing the module builds the clients and Table resource."""
+    code = (
+        "import sys, src.app; "
+        "sys.exit(src.app._TABLE is None or src.app._TABLE.name != 'test-table')"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {
+        **os.environ,
+        "TABLE_NAME": "test-table",
+        "AWS_DEFAULT_REGION": "ap-northeast-1",
+    }
+    subprocess.run([sys.executable, "-c", code], cwd=root, env=env, check=True)
 
 
-def test_get_last_seen_timestamp_found() -> None:
-    """Test get_last_seen_timestamp when the item exists."""
+def test_get_feed_state_found() -> None:
+    """Test get_feed_state when the item exists."""
+    mock_table = MagicMock()
+    mock_table.get_item.return_value = {
+        "Item": {
+            "value": 1234567890,
+            "etag": '"abc123"',
+            "modified": "Wed, 18 Feb 2026 12:00:00 GMT",
+        }
+    }
+    assert get_feed_state(mock_table) == FeedState(
+        1234567890,
+        '"abc123"',
+        "Wed, 18 Feb 2026 12:00:00 GMT",
+    )
+    mock_table.get_item.assert_called_once_with(
+        Key={"settingName": "last_seen_pub_timestamp"},
+        ProjectionExpression="#v, #etag, #mod, #since",
+        ExpressionAttributeNames={
+            "#v": "value",
+            "#etag": "etag",
+            "#mod": "modified",
+            "#since": "pendingSince",
+        },
+        ConsistentRead=False,
+    )
+
+
+def test_get_feed_state_pending() -> None:
+    """Test get_feed_state when a notification is still pending."""
+    mock_table = MagicMock()
+    mock_table.get_item.return_value = {
+        "Item": {"value": 1234567890, "pendingSince": 1234500000}
+    }
+    state = get_feed_state(mock_table)
+    assert state.last_seen_timestamp == 1234567890
+    assert state.pending_since == 1234500000
+
+
+def test_get_feed_state_decimal_value() -> None:
+    """Test get_feed_state with the Decimal type boto3 returns for numbers."""
+    mock_table = MagicMock()
+    mock_table.get_item.return_value = {"Item": {"value": Decimal("1234567890")}}
+    assert get_feed_state(mock_table) == FeedState(1234567890)
+
+
+def test_get_feed_state_without_validators() -> None:
+    """Test get_feed_state when the item has no cache validators."""
     mock_table = MagicMock()
     mock_table.get_item.return_value = {"Item": {"value": 1234567890}}
-    assert get_last_seen_timestamp(mock_table) == 1234567890
+    assert get_feed_state(mock_table) == FeedState(1234567890)
 
 
-def test_get_last_seen_timestamp_not_found() -> None:
-    """Test get_last_seen_timestamp when the item does not exist."""
+def test_get_feed_state_not_found() -> None:
+    """Test get_feed_state when the item does not exist."""
     mock_table = MagicMock()
     mock_table.get_item.return_value = {}
-    assert get_last_seen_timestamp(mock_table) == 0
+    assert get_feed_state(mock_table) == FeedState(0)
 
 
-def test_get_last_seen_timestamp_none_value() -> None:
-    """Test get_last_seen_timestamp when the value is None."""
+def test_get_feed_state_none_value() -> None:
+    """Test get_feed_state when the value is None."""
     mock_table = MagicMock()
     mock_table.get_item.return_value = {"Item": {"value": None}}
-    assert get_last_seen_timestamp(mock_table) == 0
+    assert get_feed_state(mock_table) == FeedState(0)
 
 
-def test_get_last_seen_timestamp_invalid_type() -> None:
-    """Test get_last_seen_timestamp when the value has an invalid type."""
+def test_get_feed_state_invalid_type() -> None:
+    """Test get_feed_state when the value has an invalid type."""
     mock_table = MagicMock()
     mock_table.get_item.return_value = {"Item": {"value": "invalid"}}
     with pytest.raises(TypeError, match="Unexpected type for timestamp"):
-        get_last_seen_timestamp(mock_table)
+        get_feed_state(mock_table)
+
+
+def test_get_feed_state_rejects_non_numbers() -> None:
+    """Test get_feed_state rejects numeric strings, booleans and infinity."""
+    mock_table = MagicMock()
+    for value in ("123", True, Decimal("Infinity")):
+        mock_table.get_item.return_value = {"Item": {"value": value}}
+        with pytest.raises(TypeError, match="Unexpected type for timestamp"):
+            get_feed_state(mock_table)
+
+
+def test_update_feed_state() -> None:
+    """Test update_feed_state calls update_item correctly."""
+    mock_table = MagicMock()
+    assert update_feed_state(
+        mock_table,
+        9876543210,
+        '"abc123"',
+        "Wed, 18 Feb 2026 12:00:00 GMT",
+        pending_since=9876500000,
+    )
+    mock_table.update_item.assert_called_once_with(
+        Key={"settingName": "last_seen_pub_timestamp"},
+        UpdateExpression=(
+            "SET #v = :new, #since = :since, #etag = :etag, #mod = :mod"
+        ),
+        ConditionExpression="attribute_not_exists(#v) OR #v < :new",
+        ExpressionAttributeNames={
+            "#v": "value",
+            "#etag": "etag",
+            "#mod": "modified",
+            "#since": "pendingSince",
+        },
+        ExpressionAttributeValues={
+            ":new": 9876543210,
+            ":since": 9876500000,
+            ":etag": '"abc123"',
+            ":mod": "Wed, 18 Feb 2026 12:00:00 GMT",
+        },
+    )
 
 
-def test_update_last_seen_timestamp() -> None:
-    """Test update_last_seen_timestamp calls put_item correctly."""
+def test_update_feed_state_without_validators() -> None:
+    """Test update_feed_state removes validators the server did not send."""
     mock_table = MagicMock()
-    update_last_seen_timestamp(mock_table, 9876543210)
-    mock_table.put_item.assert_called_once_with(
-        Item={"settingName": "last_seen_pub_timestamp", "value": 9876543210}
+    update_feed_state(mock_table, 9876543210, None, None, pending_since=0)
+    _, kwargs = mock_table.update_item.call_args
+    assert kwargs["UpdateExpression"] == (
+        "SET #v = :new, #since = :since REMOVE #etag, #mod"
+    )
+    assert kwargs["ExpressionAttributeValues"] == {":new": 9876543210, ":since": 0}
+
+
+def test_update_feed_state_condition_failed() -> None:
+    """Test update_feed_state reports a rejected conditional write."""
+    mock_table = MagicMock()
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        "UpdateItem",
+    )
+    assert not update_feed_state(mock_table, 9876543210, None, None, pending_since=0)
+    mock_table.update_item.assert_called_once()
+
+
+class ConditionalTable:
+    """In-memory table that applies update_item expressions like DynamoDB."""
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        self.item = item
+
+    def update_item(
+        self,
+        *,
+        Key: dict[str, str],
+        UpdateExpression: str,
+        ConditionExpression: str,
+        ExpressionAttributeNames: dict[str, str],
+        ExpressionAttributeValues: dict[str, Any],
+    ) -> None:
+        names, values = ExpressionAttributeNames, ExpressionAttributeValues
+        # Translate the condition into Python, e.g. "#v < :new" into
+        # "item.get('value') < values[':new']".
+        condition = re.sub(
+            r"attribute_(not_)?exists\((#\w+)\)",
+            lambda m: f"({names[m[2]]!r} {'not in' if m[1] else 'in'} item)",
+            ConditionExpression,
+        )
+        condition = re.sub(r"#\w+", lambda m: f"item.get({names[m[0]]!r})", condition)
+        condition = re.sub(r":\w+", lambda m: f"values[{m[0]!r}]", condition)
+        condition = (
+            condition.replace(" OR ", " or ")
+            .replace(" AND ", " and ")
+            .replace(" = ", " == ")
+        )
+        if not eval(condition, {}, {"item": self.item, "values": values}):
+            raise ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+                "UpdateItem",
+            )
+        set_part, _, remove_part = UpdateExpression.removeprefix("SET ").partition(
+            " REMOVE "
+        )
+        for action in set_part.split(", "):
+            name, value = action.split(" = ")
+            self.item[names[name]] = values[value]
+        for name in filter(None, remove_part.split(", ")):
+            self.item.pop(names[name], None)
+
+
+def test_update_feed_state_overlapping_runs() -> None:
+    """Test only one of two overlapping runs claims the same new articles."""
+    table = ConditionalTable({"value": 1000})
+
+    # Run A records 2000 and starts publishing
+    assert update_feed_state(cast(Any, table), 2000, None, None, pending_since=1000)
+    # Run B read the old state too and must not publish a second copy
+    assert not update_feed_state(
+        cast(Any, table), 2000, None, None, pending_since=1000
     )
+    assert table.item == {"value": 2000, "pendingSince": 1000}
+
+
+def test_update_feed_state_retry_pending() -> None:
+    """Test a run that read the pending marker can take it over."""
+    table = ConditionalTable({"value": 2000, "pendingSince": 1000})
+
+    assert update_feed_state(
+        cast(Any, table), 2000, None, None, pending_since=1000, retrying=True
+    )
+    # A retry of a different notification is still rejected
+    assert not update_feed_state(
+        cast(Any, table), 2000, None, None, pending_since=500, retrying=True
+    )
+
+
+def test_update_feed_state_other_error() -> None:
+    """Test update_feed_state re-raises unrelated DynamoDB errors."""
+    mock_table = MagicMock()
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": ""}},
+        "UpdateItem",
+    )
+    with pytest.raises(ClientError):
+        update_feed_state(mock_table, 9876543210, None, None, pending_since=0)
+
+
+def test_clear_pending_notification() -> None:
+    """Test clear_pending_notification removes the marker conditionally."""
+    mock_table = MagicMock()
+    clear_pending_notification(mock_table, 9876543210)
+    mock_table.update_item.assert_called_once_with(
+        Key={"settingName": "last_seen_pub_timestamp"},
+        UpdateExpression="REMOVE #since",
+        ConditionExpression="#v = :ts",
+        ExpressionAttributeNames={"#v": "value", "#since": "pendingSince"},
+        ExpressionAttributeValues={":ts": 9876543210},
+    )
+
+
+def test_clear_pending_notification_condition_failed() -> None:
+    """Test clear_pending_notification ignores a newer timestamp."""
+    mock_table = MagicMock()
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        "UpdateItem",
+    )
+    clear_pending_notification(mock_table, 9876543210)
+    mock_table.update_item.assert_called_once()
+
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>NEWS | SPITZ</title>
+    <item>
+      <title>News Title</title>
+      <link>https://spitz-web.com/news/7915/</link>
+      <pubDate>Wed, 18 Feb 2026 12:00:00 +0000</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def make_feed_response(
+    status: int, body: bytes, headers: dict[str, str] | None = None
+) -> HTTPResponse:
+    """Build an unread HTTP response, as returned with preload_content=False."""
+    return HTTPResponse(
+        body=io.BytesIO(body),
+        headers=HTTPHeaderDict(headers),
+        status=status,
+        preload_content=False,
+    )
+
+
+def test_http_pool_retry_budget() -> None:
+    """Test feed request retries and timeouts fit in the function timeout."""
+    retries = _HTTP.connection_pool_kw["retries"]
+    timeout = _HTTP.connection_pool_kw["timeout"]
+    attempts = retries.total + 1
+    assert attempts * (timeout.connect_timeout + timeout.read_timeout) < 30
+
+
+@patch("src.app._HTTP")
+def test_fetch_feed_requests_compression(mock_http: MagicMock) -> None:
+    """Test every feed request negotiates gzip, with or without validators."""
+    mock_http.request.return_value = make_feed_response(304, b"")
+
+    fetch_feed(None, None)
+    fetch_feed('"old"', None)
+
+    for _, kwargs in mock_http.request.call_args_list:
+        assert "gzip" in kwargs["headers"]["accept-encoding"]
+
+
+@patch("src.app._HTTP")
+def test_fetch_feed(mock_http: MagicMock) -> None:
+    """Test fetch_feed sends validators and parses the response body."""
+    mock_http.request.return_value = make_feed_response(
+        200,
+        SAMPLE_FEED,
+        {
+            "Content-Type": "application/rss+xml; charset=UTF-8",
+            "ETag": '"new"',
+            "Last-Modified": "Wed, 18 Feb 2026 12:00:00 GMT",
+        },
+    )
+
+    with patch("src.app.USE_FEEDPARSER", False):
+        feed = fetch_feed('"old"', "Tue, 17 Feb 2026 12:00:00 GMT")
+
+    mock_http.request.assert_called_once()
+    args, kwargs = mock_http.request.call_args
+    assert args == ("GET", "https://spitz-web.com/news/feed")
+    assert kwargs["preload_content"] is False
+    assert kwargs["headers"]["If-None-Match"] == '"old"'
+    assert kwargs["headers"]["If-Modified-Since"] == "Tue, 17 Feb 2026 12:00:00 GMT"
+    assert kwargs["headers"]["user-agent"] == "spitz-news-mikke/1.0"
+    assert feed.status == 200
+    assert feed.etag == '"new"'
+    assert feed.modified == "Wed, 18 Feb 2026 12:00:00 GMT"
+    assert len(feed.entries) == 1
+    assert feed.entries[0].title == "News Title"
+    assert feed.entries[0].link == "https://spitz-web.com/news/7915/"
+    assert tuple(feed.entries[0].published_parsed[:6]) == (2026, 2, 18, 12, 0, 0)
+
+
+@patch("src.app._HTTP")
+def test_fetch_feed_not_modified(mock_http: MagicMock) -> None:
+    """Test fetch_feed returns an empty 304 result without parsing."""
+    mock_http.request.return_value = make_feed_response(304, b"")
+
+    feed = fetch_feed(None, None)
+
+    _, kwargs = mock_http.request.call_args
+    assert "If-None-Match" not in kwargs["headers"]
+    assert "If-Modified-Since" not in kwargs["headers"]
+    assert feed.status == 304
+    assert feed.entries == []
+
+
+@patch("src.app.parse_spitz_feed")
+@patch("src.app._HTTP")
+def test_fetch_feed_with_feedparser(
+    mock_http: MagicMock, mock_parse_spitz_feed: MagicMock
+) -> None:
+    """Test fetch_feed parses with feedparser when USE_FEEDPARSER is set."""
+    mock_http.request.return_value = make_feed_response(200, SAMPLE_FEED)
+
+    with (
+        patch("src.app.USE_FEEDPARSER", True),
+        patch("feedparser.parse", wraps=feedparser.parse) as mock_feedparser_parse,
+    ):
+        feed = fetch_feed(None, None)
+
+    # The sanitizer and relative URI resolution must stay disabled
+    _, kwargs = mock_feedparser_parse.call_args
+    assert kwargs["resolve_relative_uris"] is False
+    assert kwargs["sanitize_html"] is False
+    mock_parse_spitz_feed.assert_not_called()
+    assert feed.etag is None
+    assert feed.modified is None
+    assert len(feed.entries) == 1
+    assert feed.entries[0].link == "https://spitz-web.com/news/7915/"
+    assert tuple(feed.entries[0].published_parsed[:6]) == (2026, 2, 18, 12, 0, 0)
+
+
+def test_parse_feed_with_feedparser_skips_undated() -> None:
+    """Test the feedparser fallback skips entries without a date."""
+    body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <link>https://spitz-web.com/news/7915/</link>
+      <pubDate>Wed, 18 Feb 2026 12:00:00 +0000</pubDate>
+    </item>
+    <item>
+      <title>No date</title>
+      <link>https://spitz-web.com/news/7914/</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+    entries = parse_feed_with_feedparser(body, {})
+
+    assert [e.link for e in entries] == ["https://spitz-web.com/news/7915/"]
+    assert entries[0].title == ""
+
+
+@patch("src.app._HTTP")
+def test_fetch_feed_unexpected_status(mock_http: MagicMock) -> None:
+    """Test fetch_feed returns no entries on an error response."""
+    mock_http.request.return_value = make_feed_response(503, b"<html></html>")
+
+    feed = fetch_feed(None, None)
+
+    assert feed.status == 503
+    assert feed.entries == []
+
+
+def test_import_does_not_load_feedparser() -> None:
+    """Test that feedparser is only imported when the fallback is used."""
+    code = "import sys, src.app; sys.exit('feedparser' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+def test_parse_spitz_feed() -> None:
+    """Test parse_spitz_feed reads items and normalizes pubDate to UTC."""
+    body = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title>新着ニュース</title>
+      <link>https://spitz-web.com/news/7915/</link>
+      <pubDate>Wed, 18 Feb 2026 21:00:00 +0900</pubDate>
+    </item>
+    <item>
+      <title>No date</title>
+      <link>https://spitz-web.com/news/7914/</link>
+    </item>
+    <item>
+      <title>Older News</title>
+      <link>https://spitz-web.com/news/7913/</link>
+      <pubDate>Tue, 17 Feb 2026 12:00:00 +0000</pubDate>
+    </item>
+  </channel>
+</rss>
+""".encode()
+
+    entries = parse_spitz_feed(body)
+
+    assert [e.link for e in entries] == [
+        "https://spitz-web.com/news/7915/",
+        "https://spitz-web.com/news/7913/",
+    ]
+    assert entries[0].title == "新着ニュース"
+    # 21:00 JST is 12:00 UTC
+    assert tuple(entries[0].published_parsed[:6]) == (2026, 2, 18, 12, 0, 0)
+    assert tuple(entries[1].published_parsed[:6]) == (2026, 2, 17, 12, 0, 0)
+
+
+def test_parse_spitz_feed_date_fallback() -> None:
+    """Test parse_spitz_feed accepts ISO 8601 dates and skips invalid ones."""
+    body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title>ISO date</title>
+      <link>https://spitz-web.com/news/7915/</link>
+      <pubDate>2026-02-18T21:00:00+09:00</pubDate>
+    </item>
+    <item>
+      <title>Bad date</title>
+      <link>https://spitz-web.com/news/7914/</link>
+      <pubDate>not a date</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+    entries = parse_spitz_feed(body)
+
+    assert [e.link for e in entries] == ["https://spitz-web.com/news/7915/"]
+    assert tuple(entries[0].published_parsed[:6]) == (2026, 2, 18, 12, 0, 0)
 
 
 @patch("src.app.boto3.client")
@@ -152,129 +679,455 @@ def test_send_notification(mock_sns_client: MagicMock) -> None:
     assert "https://example.com/news/1" in kwargs["Message"]
     # Check for JST formatted date
     assert "公開日: 2026/02/18 21:00" in kwargs["Message"]
-    assert "【スピッツニュース】" in kwargs["Subject"]
+    assert kwargs["Message"] == (
+        "新しいスピッツのニュースがあります！\n\n"
+        "タイトル: News Title\n"
+        "URL: https://example.com/news/1\n"
+        "公開日: 2026/02/18 21:00\n\n"
+    )
+    assert kwargs["Subject"] == "【スピッツニュース】新着ニュース (1件) があります！"
 
 
+@patch("src.app._feed_validators", None)
 @patch("src.app.send_notification")
-@patch("src.app.update_last_seen_timestamp")
+@patch("src.app.update_feed_state")
 @patch("src.app.filter_new_articles")
-@patch("src.app.feedparser.parse")
-@patch("src.app.get_last_seen_timestamp")
-@patch("src.app.get_aws_resources")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
 def test_lambda_handler_new_news(
-    mock_get_aws: MagicMock,
-    mock_get_last_seen: MagicMock,
-    mock_feedparser: MagicMock,
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
     mock_filter_articles: MagicMock,
-    mock_update_last_seen: MagicMock,
+    mock_update_feed_state: MagicMock,
     mock_send_notification: MagicMock,
 ) -> None:
     """Test that lambda_handler processes new news correctly."""
-    env = {"TABLE_NAME": "test-table", "TOPIC_ARN": "test-topic"}
-    with patch.dict(os.environ, env):
-        mock_dynamodb = MagicMock()
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_table = MagicMock()
         mock_sns = MagicMock()
-        mock_get_aws.return_value = (mock_dynamodb, mock_sns)
-        mock_get_last_seen.return_value = 1000
+        mock_get_resources.return_value = (mock_table, mock_sns)
+        mock_get_feed_state.return_value = FeedState(1000, '"old"', None)
 
         mock_feed = MagicMock()
+        mock_feed.status = 200
+        mock_feed.etag = '"new"'
+        mock_feed.modified = "Wed, 18 Feb 2026 12:00:00 GMT"
         mock_entry = MagicMock()
         mock_entry.published_parsed = (2026, 2, 18, 12, 0, 0, 2, 49, 0)
         mock_feed.entries = [mock_entry]
-        mock_feedparser.return_value = mock_feed
+        mock_fetch_feed.return_value = mock_feed
 
         mock_filter_articles.return_value = [mock_entry]
 
-        response = lambda_handler(cast(Any, {"source": "aws.events"}), MagicMock())
+        with patch("src.app.clear_pending_notification") as mock_clear_pending:
+            response = lambda_handler(
+                cast(Any, {"source": "aws.events"}), MagicMock()
+            )
 
         assert response["statusCode"] == 200
         assert "Found and notified" in response["body"]
 
+        # Verify the stored validators are sent with the request
+        mock_fetch_feed.assert_called_once_with('"old"', None)
+
         # Verify side effects are called
-        mock_update_last_seen.assert_called_once()
+        mock_update_feed_state.assert_called_once_with(
+            mock_table,
+            calendar.timegm(mock_entry.published_parsed),
+            '"new"',
+            "Wed, 18 Feb 2026 12:00:00 GMT",
+            pending_since=1000,
+            retrying=False,
+        )
         mock_send_notification.assert_called_once()
+        mock_clear_pending.assert_called_once_with(
+            mock_table, calendar.timegm(mock_entry.published_parsed)
+        )
 
 
+@patch("src.app._feed_validators", ('"cached"', None))
 @patch("src.app.send_notification")
-@patch("src.app.update_last_seen_timestamp")
+@patch("src.app.update_feed_state")
 @patch("src.app.filter_new_articles")
-@patch("src.app.feedparser.parse")
-@patch("src.app.get_last_seen_timestamp")
-@patch("src.app.get_aws_resources")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_warm_uses_cached_validators(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test that a warm lambda_handler fetches with the container's validators."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(2000, '"stored"', None)
+
+        mock_feed = MagicMock()
+        mock_feed.status = 304
+        mock_feed.entries = []
+        mock_fetch_feed.return_value = mock_feed
+
+        response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 200
+        assert "No new news found" in response["body"]
+
+        mock_get_feed_state.assert_called_once()
+        mock_fetch_feed.assert_called_once_with('"cached"', None)
+        mock_update_feed_state.assert_not_called()
+        mock_send_notification.assert_not_called()
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_notification_error(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test that a failed SNS publish is reported and left pending."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(1000)
+
+        mock_feed = MagicMock()
+        mock_entry = MagicMock()
+        mock_entry.published_parsed = (2026, 2, 18, 12, 0, 0, 2, 49, 0)
+        mock_feed.entries = [mock_entry]
+        mock_fetch_feed.return_value = mock_feed
+
+        mock_filter_articles.return_value = [mock_entry]
+        mock_send_notification.side_effect = ClientError(
+            {"Error": {"Code": "Throttling", "Message": "Publish Error"}},
+            "Publish",
+        )
+
+        with patch("src.app.clear_pending_notification") as mock_clear_pending:
+            response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 500
+        assert "Publish Error" in response["body"]
+        mock_update_feed_state.assert_called_once()
+        mock_clear_pending.assert_not_called()
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
 def test_lambda_handler_no_new_news(
-    mock_get_aws: MagicMock,
-    mock_get_last_seen: MagicMock,
-    mock_feedparser: MagicMock,
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
     mock_filter_articles: MagicMock,
-    mock_update_last_seen: MagicMock,
+    mock_update_feed_state: MagicMock,
     mock_send_notification: MagicMock,
 ) -> None:
     """Test that lambda_handler handles no new news correctly."""
-    env = {"TABLE_NAME": "test-table", "TOPIC_ARN": "test-topic"}
-    with patch.dict(os.environ, env):
-        mock_get_aws.return_value = (MagicMock(), MagicMock())
-        mock_get_last_seen.return_value = 2000
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(2000)
 
         mock_feed = MagicMock()
         mock_entry = MagicMock()
+        mock_entry.published_parsed = time.gmtime(2000)
         mock_feed.entries = [mock_entry]
-        mock_feedparser.return_value = mock_feed
-
-        mock_filter_articles.return_value = []
+        mock_fetch_feed.return_value = mock_feed
 
         response = lambda_handler(cast(Any, {}), MagicMock())
 
         assert response["statusCode"] == 200
         assert "No new news found" in response["body"]
 
+        # Verify the newest entry alone decided there is nothing new
+        mock_filter_articles.assert_not_called()
+
         # Verify side effects are NOT called
-        mock_update_last_seen.assert_not_called()
+        mock_update_feed_state.assert_not_called()
+        mock_send_notification.assert_not_called()
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_not_modified(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test that lambda_handler short-circuits on HTTP 304 Not Modified."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(
+            2000,
+            '"abc123"',
+            "Wed, 18 Feb 2026 12:00:00 GMT",
+        )
+
+        mock_feed = MagicMock()
+        mock_feed.status = 304
+        mock_feed.entries = []
+        mock_fetch_feed.return_value = mock_feed
+
+        response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 200
+        assert "No new news found" in response["body"]
+
+        mock_fetch_feed.assert_called_once_with(
+            '"abc123"', "Wed, 18 Feb 2026 12:00:00 GMT"
+        )
+
+        # Verify nothing past the fetch is touched
+        mock_filter_articles.assert_not_called()
+        mock_update_feed_state.assert_not_called()
+        mock_send_notification.assert_not_called()
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app._EXECUTOR")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_not_modified_warms_container(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_executor: MagicMock,
+) -> None:
+    """Test that a cold 304 lets the next invocation take the warm path."""
+
+    def run_now(fn: Callable[..., object], *args: object) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(fn(*args))
+        return future
+
+    mock_executor.submit.side_effect = run_now
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(2000, '"abc123"', None)
+        mock_feed = MagicMock()
+        mock_feed.status = 304
+        mock_fetch_feed.return_value = mock_feed
+
+        lambda_handler(cast(Any, {}), MagicMock())
+        mock_executor.submit.assert_not_called()
+
+        response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert "No new news found" in response["body"]
+        assert mock_executor.submit.call_count == 2
+        mock_fetch_feed.assert_called_with('"abc123"', None)
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_retries_pending_notification(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test that an undelivered notification is resent from the full feed."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(
+            2000, '"abc123"', None, pending_since=1000
+        )
+
+        mock_feed = MagicMock()
+        mock_entry = MagicMock()
+        mock_entry.published_parsed = time.gmtime(2000)
+        mock_feed.entries = [mock_entry]
+        mock_fetch_feed.return_value = mock_feed
+
+        mock_filter_articles.return_value = [mock_entry]
+
+        with patch("src.app.clear_pending_notification") as mock_clear_pending:
+            response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 200
+        assert "Found and notified" in response["body"]
+
+        # The validators must not be sent, or a 304 would hide the articles
+        mock_fetch_feed.assert_called_once_with(None, None)
+        mock_filter_articles.assert_called_once_with(mock_feed.entries, 1000)
+        _, kwargs = mock_update_feed_state.call_args
+        assert kwargs["pending_since"] == 1000
+        assert kwargs["retrying"] is True
+        mock_send_notification.assert_called_once()
+        mock_clear_pending.assert_called_once()
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_retries_pending_after_newest_removed(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test a retry still records when the newest pending article is gone."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(
+            3000, None, None, pending_since=1000
+        )
+
+        # The article at 3000 was taken down, so the feed now ends at 2000
+        mock_feed = MagicMock()
+        mock_entry = MagicMock()
+        mock_entry.published_parsed = time.gmtime(2000)
+        mock_feed.entries = [mock_entry]
+        mock_fetch_feed.return_value = mock_feed
+
+        mock_filter_articles.return_value = [mock_entry]
+        mock_update_feed_state.return_value = True
+
+        with patch("src.app.clear_pending_notification") as mock_clear_pending:
+            response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 200
+        assert "Found and notified" in response["body"]
+        args, kwargs = mock_update_feed_state.call_args
+        assert args[1] == 3000
+        assert kwargs["pending_since"] == 1000
+        assert kwargs["retrying"] is True
+        mock_send_notification.assert_called_once()
+        mock_clear_pending.assert_called_once_with(ANY, 3000)
+
+
+@patch("src.app._feed_validators", None)
+@patch("src.app.send_notification")
+@patch("src.app.update_feed_state")
+@patch("src.app.filter_new_articles")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_already_recorded(
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
+    mock_filter_articles: MagicMock,
+    mock_update_feed_state: MagicMock,
+    mock_send_notification: MagicMock,
+) -> None:
+    """Test that no notification is sent when another run recorded it first."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(1000)
+
+        mock_feed = MagicMock()
+        mock_entry = MagicMock()
+        mock_entry.published_parsed = time.gmtime(2000)
+        mock_feed.entries = [mock_entry]
+        mock_fetch_feed.return_value = mock_feed
+
+        mock_filter_articles.return_value = [mock_entry]
+        mock_update_feed_state.return_value = False
+
+        response = lambda_handler(cast(Any, {}), MagicMock())
+
+        assert response["statusCode"] == 200
+        assert "No new news found" in response["body"]
         mock_send_notification.assert_not_called()
 
 
 def test_lambda_handler_missing_env_vars() -> None:
     """Test that lambda_handler returns 500 when required env vars are missing."""
-    with patch.dict(os.environ, {}, clear=True):
+    with patch.multiple("src.app", TABLE_NAME=None, TOPIC_ARN=None):
         response = lambda_handler(cast(Any, {}), MagicMock())
         assert response["statusCode"] == 500
         assert "Missing environment variables" in response["body"]
 
 
-@patch("src.app.get_aws_resources")
-def test_lambda_handler_processing_error(mock_get_aws: MagicMock) -> None:
-    """Test that lambda_handler returns 500 on unexpected processing error."""
-    env = {"TABLE_NAME": "test-table", "TOPIC_ARN": "test-topic"}
-    with patch.dict(os.environ, env):
-        mock_get_aws.side_effect = Exception("Test Error")
+@patch("src.app._feed_validators", None)
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_aws_error(mock_get_resources: MagicMock) -> None:
+    """Test that lambda_handler returns 500 when an AWS request fails."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "Test Error"}},
+            "GetItem",
+        )
 
         response = lambda_handler(cast(Any, {}), MagicMock())
         assert response["statusCode"] == 500
-        assert "Error: Test Error" in response["body"]
+        assert "Error:" in response["body"]
+        assert "Test Error" in response["body"]
+
 
+@patch("src.app._feed_validators", None)
+@patch("src.app.get_cached_resources")
+def test_lambda_handler_processing_error(mock_get_resources: MagicMock) -> None:
+    """Test that lambda_handler lets unexpected errors propagate to Lambda."""
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.side_effect = Exception("Test Error")
 
+        with pytest.raises(Exception, match="Test Error"):
+            lambda_handler(cast(Any, {}), MagicMock())
+
+
+@patch("src.app._feed_validators", None)
 @patch("src.app.send_notification")
-@patch("src.app.update_last_seen_timestamp")
+@patch("src.app.update_feed_state")
 @patch("src.app.filter_new_articles")
-@patch("src.app.feedparser.parse")
-@patch("src.app.get_last_seen_timestamp")
-@patch("src.app.get_aws_resources")
+@patch("src.app.fetch_feed")
+@patch("src.app.get_feed_state")
+@patch("src.app.get_cached_resources")
 def test_lambda_handler_empty_feed(
-    mock_get_aws: MagicMock,
-    mock_get_last_seen: MagicMock,
-    mock_feedparser: MagicMock,
+    mock_get_resources: MagicMock,
+    mock_get_feed_state: MagicMock,
+    mock_fetch_feed: MagicMock,
     mock_filter_articles: MagicMock,
-    mock_update_last_seen: MagicMock,
+    mock_update_feed_state: MagicMock,
     mock_send_notification: MagicMock,
 ) -> None:
     """Test that lambda_handler handles an empty feed correctly."""
-    env = {"TABLE_NAME": "test-table", "TOPIC_ARN": "test-topic"}
-    with patch.dict(os.environ, env):
-        mock_get_aws.return_value = (MagicMock(), MagicMock())
-        mock_get_last_seen.return_value = 1000
+    with patch.multiple("src.app", TABLE_NAME="test-table", TOPIC_ARN="test-topic"):
+        mock_get_resources.return_value = (MagicMock(), MagicMock())
+        mock_get_feed_state.return_value = FeedState(1000)
 
         mock_feed = MagicMock()
         mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
+        mock_fetch_feed.return_value = mock_feed
 
         response = lambda_handler(cast(Any, {}), MagicMock())
 
@@ -282,5 +1135,5 @@ def test_lambda_handler_empty_feed(
         assert "No entries found in feed" in response["body"]
         
         # Verify side effects are NOT called
-        mock_update_last_seen.assert_not_called()
+        mock_update_feed_state.assert_not_called()
         mock_send_notification.assert_not_called()